@@ -1,9 +1,19 @@
+import asyncio
 import os
+import re
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from io import StringIO
+from pathlib import Path
+import numpy as np
 import pandas as pd
 import streamlit as st
-import altair as alt
 import requests
-from bs4 import BeautifulSoup
+from http.cookiejar import DefaultCookiePolicy
+from requests.adapters import HTTPAdapter
+from rapidfuzz import fuzz, process
 from espn_api.football import League
 
 st.set_page_config(
@@ -22,105 +32,220 @@ def safe_float(x, default=0.0) -> float:
         return default
 
 
-# --------------- FantasyPros Scrape (no lxml) ---------------
-@st.cache_data(ttl=6 * 60 * 60)
-def _fp_fetch_table(url: str) -> pd.DataFrame:
-    """Scrape FantasyPros projection table with id='data'. Parse Player, team, bye."""
-    import re
+@st.cache_resource
+def http_session() -> requests.Session:
+    """Pooled HTTP session shared across reruns so TCP/TLS connections are reused."""
+    s = requests.Session()
+    # Shared by every viewer: never store response cookies, credentials go per request
+    s.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(pool_maxsize=20)
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    return s
+
+
+# --------------- FantasyPros Scrape ---------------
+FP_CACHE_DIR = Path(__file__).with_name(".fp_cache")
+FP_CACHE_TTL = 6 * 60 * 60
+_TEAM_RE = re.compile(r"\(([^)]+)\)")  # team tag in the Player cell, e.g. "Name (BUF)"
+
+
+def _fp_cache_path(url: str) -> Path:
+    # One file per page per 6h bucket, e.g. qb_php_scoring_ppr_81234.parquet
+    slug = re.sub(r"\W+", "_", url.split("/projections/")[-1])
+    return FP_CACHE_DIR / f"{slug}_{int(time.time() // FP_CACHE_TTL)}.parquet"
+
+
+def _fp_write_cache(df: pd.DataFrame, path: Path):
+    try:
+        FP_CACHE_DIR.mkdir(exist_ok=True)
+        df.to_parquet(path, index=False)
+        slug = path.stem.rsplit("_", 1)[0]
+        for old in FP_CACHE_DIR.glob(f"{slug}_*.parquet"):
+            if old != path:
+                old.unlink(missing_ok=True)
+    except Exception:
+        pass  # disk tier is best effort (read-only FS, non-Arrow column types)
 
-    r = requests.get(url, headers={"User-Agent": "Mozilla/5.0"})
-    r.raise_for_status()
 
-    soup = BeautifulSoup(r.text, "html.parser")
-    table = soup.find("table", {"id": "data"})
-    if not table:
+def _fp_read_cache(url: str):
+    # Disk tier survives restarts / new workers; st.cache_data on the callers covers hot reruns
+    cache_path = _fp_cache_path(url)
+    if cache_path.exists():
+        try:
+            return pd.read_parquet(cache_path)
+        except Exception:
+            pass
+    return None
+
+
+def _fp_parse_table(html: str) -> pd.DataFrame:
+    """Parse the FantasyPros projection table with id='data'. Parse Player, team, bye."""
+    try:
+        # lxml locates the table by id and parses it in one pass
+        df = pd.read_html(StringIO(html), attrs={"id": "data"}, flavor="lxml")[0]
+    except ValueError:  # no table with id='data' on the page
         return pd.DataFrame()
 
-    thead = table.find("thead")
-    tbody = table.find("tbody")
-    headers = [th.get_text(strip=True) for th in thead.find_all("th")]
-    rows = []
-    for tr in tbody.find_all("tr"):
-        cols = [td.get_text(strip=True) for td in tr.find_all("td")]
-        if cols:
-            rows.append(cols)
-    df = pd.DataFrame(rows, columns=headers)
+    # Skill-position tables stack a category row (PASSING / RUSHING ...) over the stat names;
+    # keep the category only where a stat name repeats (YDS, TDS) so columns stay unique
+    if isinstance(df.columns, pd.MultiIndex):
+        dup = df.columns.get_level_values(-1).duplicated(keep=False)
+        df.columns = [f"{c[0]} {c[-1]}" if d else c[-1] for c, d in zip(df.columns, dup)]
 
     # Extract team/bye from Player column when possible
     if "Player" in df.columns:
         df["_raw"] = df["Player"]
-
-        def extract_team(s):
-            m = re.search(r"\(([^)]+)\)", s or "")
-            return m.group(1) if m else "N/A"
-
-        df["FP_Team"] = df["_raw"].apply(extract_team)
-        df["Player"] = df["_raw"].str.replace(r"\s+\(.*\)", "", regex=True)
+        df["FP_Team"] = df["_raw"].str.extract(_TEAM_RE, expand=False).fillna("N/A")
+        df["Player"] = df["_raw"].str.partition("(")[0].str.strip()
 
     if "Bye" in df.columns:
         df["FP_Bye"] = df["Bye"]
     else:
         df["FP_Bye"] = "N/A"
+
+    # Parse projected points once so lookups read a ready float column
+    if "FPTS" in df.columns:
+        df["FPTS_num"] = pd.to_numeric(df["FPTS"], errors="coerce").fillna(0.0)
     return df
 
 
+async def _fp_get_pages(urls: list) -> list:
+    """GET every page over one HTTP/2 connection; each slot is the body text or the exception."""
+    import httpx
+
+    async def _get(client, url):
+        r = await client.get(url)
+        r.raise_for_status()
+        return r.text
+
+    async with httpx.AsyncClient(
+        http2=True, headers={"User-Agent": "Mozilla/5.0"}, follow_redirects=True, timeout=20.0
+    ) as client:
+        return await asyncio.gather(*(_get(client, u) for u in urls), return_exceptions=True)
+
+
+FP_POSITIONS = ["qb", "rb", "wr", "te", "k", "dst"]
+
+
+def _fp_fetch_positions(url_fmt: str, label: str) -> dict:
+    """Fetch every position's table concurrently; a failed position warns and comes back empty."""
+    urls = {p: url_fmt.format(pos=p) for p in FP_POSITIONS}
+    out = {p: _fp_read_cache(u) for p, u in urls.items()}
+    missing = [p for p, df in out.items() if df is None]
+    if missing:
+        pages = asyncio.run(_fp_get_pages([urls[p] for p in missing]))
+        for p, page in zip(missing, pages):
+            try:
+                if isinstance(page, Exception):
+                    raise page
+                out[p] = _fp_parse_table(page)
+                if not out[p].empty:
+                    _fp_write_cache(out[p], _fp_cache_path(urls[p]))
+            except Exception as e:
+                st.warning(f"FantasyPros {label} fetch failed for {p}: {e}")
+                out[p] = pd.DataFrame()
+    return out
+
+
 @st.cache_data(ttl=6 * 60 * 60)
 def fp_weekly_all(scoring="ppr") -> dict:
-    pos = ["qb", "rb", "wr", "te", "k", "dst"]
-    out = {}
-    for p in pos:
-        url = f"https://www.fantasypros.com/nfl/projections/{p}.php?scoring={scoring}"
-        try:
-            out[p] = _fp_fetch_table(url)
-        except Exception as e:
-            st.warning(f"FantasyPros weekly fetch failed for {p}: {e}")
-            out[p] = pd.DataFrame()
-    return out
+    url_fmt = "https://www.fantasypros.com/nfl/projections/{pos}.php?scoring=" + scoring
+    return _fp_fetch_positions(url_fmt, "weekly")
 
 
 @st.cache_data(ttl=6 * 60 * 60)
 def fp_season_all(scoring="ppr") -> dict:
-    pos = ["qb", "rb", "wr", "te", "k", "dst"]
-    out = {}
-    for p in pos:
-        url = f"https://www.fantasypros.com/nfl/projections/{p}.php?week=draft&scoring={scoring}"
-        try:
-            out[p] = _fp_fetch_table(url)
-        except Exception as e:
-            st.warning(f"FantasyPros season fetch failed for {p}: {e}")
-            out[p] = pd.DataFrame()
-    return out
+    url_fmt = "https://www.fantasypros.com/nfl/projections/{pos}.php?week=draft&scoring=" + scoring
+    return _fp_fetch_positions(url_fmt, "season")
+
+
+FP_POS_KEYS = {"QB": "qb", "RB": "rb", "WR": "wr", "TE": "te", "K": "k", "D/ST": "dst"}
 
 
 def _pos_key(player) -> str:
-    mp = {"QB": "qb", "RB": "rb", "WR": "wr", "TE": "te", "K": "k", "D/ST": "dst"}
-    return mp.get(getattr(player, "position", "").upper(), "")
+    return FP_POS_KEYS.get(getattr(player, "position", "").upper(), "")
+
 
+def _fp_index(df: pd.DataFrame) -> dict:
+    """Lookups for one FP table: lowercased full name / last word -> row, plus names for fuzzy matching."""
+    full, last = {}, {}
+    if not df.empty and "Player" in df.columns:
+        for rec in df.to_dict("records"):
+            nm = rec["Player"].strip().lower() if isinstance(rec["Player"], str) else ""
+            if nm:
+                full.setdefault(nm, rec)
+                last.setdefault(nm.rsplit(" ", 1)[-1], rec)
+    return {"full": full, "last": last, "names": list(full)}
 
-def _fp_match_row(df: pd.DataFrame, name: str):
-    if df.empty or "Player" not in df.columns:
+
+def _fp_match_row(idx: dict, name: str):
+    if not idx:
+        return None
+    key = name.strip().lower()
+    if not key:
         return None
-    # Loose match on first name segment to be resilient to variants
-    first = name.split()[0]
-    hit = df[df["Player"].str.contains(first, case=False, na=False)]
-    return hit.iloc[0] if not hit.empty else None
+    hit = idx["full"].get(key)
+    if hit is not None:
+        return hit
+    # ESPN "Bills D/ST" vs FantasyPros "Buffalo Bills": match the nickname on the last word
+    if key.endswith(" d/st"):
+        hit = idx["last"].get(key[: -len(" d/st")].strip())
+        if hit is not None:
+            return hit
+    # Fuzzy fallback for spelling variants (D.J. / DJ, Jr. suffixes, ...). token_sort_ratio scores
+    # whole names; WRatio's partial matching handed "Sam" the row for "Deebo Samuel Sr."
+    match = process.extractOne(key, idx["names"], scorer=fuzz.token_sort_ratio, score_cutoff=85)
+    return idx["full"][match[0]] if match else None
+
+
+# Light stand-in for an ESPN player, built from a FantasyPros row (FA fallback)
+FPPlayer = namedtuple(
+    "FPPlayer",
+    ["name", "position", "proTeam", "bye_week", "weekly_fpts", "season_fpts"],
+    defaults=("N/A", "N/A", 0.0, 0.0),
+)
+
+
+def fp_free_agents(pos: str, rostered_names: frozenset, limit: int) -> list:
+    """Top unrostered FantasyPros players at `pos`, carrying their weekly/season FPTS."""
+    key = FP_POS_KEYS[pos]
+    df = FP_WEEKLY.get(key, pd.DataFrame())
+    if df.empty or "FPTS_num" not in df.columns:
+        return []
+    mask = ~df["Player"].isin(rostered_names)
+    top = df.loc[mask, ["Player", "FPTS_num"]].nlargest(limit, "FPTS_num")
+
+    season = FP_SEASON_IDX.get(key)
+    out = []
+    for name, wk in zip(top["Player"].to_numpy(), top["FPTS_num"].to_numpy()):
+        srow = _fp_match_row(season, name)
+        season_fpts = float(srow.get("FPTS_num", 0.0)) if srow is not None else 0.0
+        out.append(FPPlayer(name, pos, weekly_fpts=float(wk), season_fpts=season_fpts))
+    return out
 
 
 # --------------- ESPN / FP projection helpers ---------------
+# Streamlit re-executes this script on every rerun, so these memo caches are rebuilt
+# per render: each player is projected once per run and always sees the current
+# projection source and FP tables.
+@lru_cache(maxsize=None)
 def get_proj_week(player, week=None) -> float:
     """Weekly projection based on sidebar source: ESPN only, FP fallback, FP only."""
+    if isinstance(player, FPPlayer):
+        # FA fallback rows already carry their FantasyPros weekly points
+        return 0.0 if proj_source == "ESPN only" else player.weekly_fpts
+
     if week is None:
         week = league.current_week
 
     # ESPN first (if toggled)
     if proj_source in ["ESPN only", "FantasyPros fallback"]:
         try:
-            if hasattr(player, "stats") and week in player.stats:
-                v = player.stats[week].get("projected", 0) or 0
-                if v:
-                    return safe_float(v)
-            if getattr(player, "projected_points", None):
-                return safe_float(player.projected_points)
+            weekly = (getattr(player, "stats", None) or {}).get(week) or {}
+            v = weekly.get("projected") or getattr(player, "projected_points", None)
+            if v:
+                return safe_float(v)
         except Exception:
             pass
         if proj_source == "ESPN only":
@@ -130,40 +255,46 @@ def get_proj_week(player, week=None) -> float:
     if proj_source in ["FantasyPros fallback", "FantasyPros only"]:
         key = _pos_key(player)
         if key:
-            df = FP_WEEKLY.get(key, pd.DataFrame())
-            row = _fp_match_row(df, player.name)
+            row = _fp_match_row(FP_WEEKLY_IDX.get(key), player.name)
             if row is not None:
-                return safe_float(row.get("FPTS", 0))
+                return float(row.get("FPTS_num", 0.0))
     return 0.0
 
 
+NFL_LAST_WEEK = 18
+
+
+@lru_cache(maxsize=None)
 def get_ros_espn(player, start_week=None) -> float:
     """Sum ESPN weekly projected stats from current week forward."""
     try:
         if start_week is None:
             start_week = league.current_week
-        total = 0.0
-        if hasattr(player, "stats"):
-            for wk, vals in player.stats.items():
-                if isinstance(wk, int) and wk >= start_week:
-                    total += safe_float(vals.get("projected", 0))
-        return total
+        stats = getattr(player, "stats", None) or {}
+        # ESPN projections are already numeric, so sum them directly over the remaining weeks
+        return float(sum(
+            (stats[wk] or {}).get("projected") or 0.0
+            for wk in range(start_week, NFL_LAST_WEEK + 1) if wk in stats
+        ))
     except Exception:
         return 0.0
 
 
+@lru_cache(maxsize=None)
 def get_ros_fp(player) -> float:
     """FantasyPros season total (FPTS)."""
+    if isinstance(player, FPPlayer):
+        return player.season_fpts
     key = _pos_key(player)
     if not key:
         return 0.0
-    df = FP_SEASON.get(key, pd.DataFrame())
-    row = _fp_match_row(df, player.name)
+    row = _fp_match_row(FP_SEASON_IDX.get(key), player.name)
     if row is not None:
-        return safe_float(row.get("FPTS", 0))
+        return float(row.get("FPTS_num", 0.0))
     return 0.0
 
 
+@lru_cache(maxsize=None)
 def ros_estimate(player) -> float:
     """
     Best-effort ROS:
@@ -178,35 +309,92 @@ def ros_estimate(player) -> float:
     if fp > 0:
         return fp
     wk = get_proj_week(player)
-    weeks_rem = max(0, 18 - int(getattr(league, "current_week", 1)))
+    weeks_rem = max(0, NFL_LAST_WEEK - int(getattr(league, "current_week", 1)))
     return weeks_rem * wk
 
 
 # --------------- Optimizer ---------------
+FLEX_POSITIONS = ["RB", "WR", "TE"]
+
+
 def build_optimizer(roster, starting_slots: dict):
-    groups = {k: [] for k in ["QB", "RB", "WR", "TE", "D/ST", "K", "FLEX"]}
-    for p in roster:
-        pos = getattr(p, "position", "")
-        if pos in groups:
-            groups[pos].append(p)
-    for pos in ["RB", "WR", "TE"]:
-        groups["FLEX"].extend(groups[pos])
-
-    for pos in groups:
-        groups[pos].sort(key=lambda pl: get_proj_week(pl), reverse=True)
-
-    used = set()
+    """Returns (lineup, bench, proj_map) where proj_map[player] = (weekly, ROS est.)."""
+    roster = list(roster)
+    # One projection per player; each slot takes the top-N still-unused eligible rows
+    df = pd.DataFrame({
+        "pos": [getattr(p, "position", "") for p in roster],
+        "proj": np.fromiter((get_proj_week(p) for p in roster), dtype=float, count=len(roster)),
+        "ros": np.fromiter((ros_estimate(p) for p in roster), dtype=float, count=len(roster)),
+    })
     lineup = {slot: [] for slot in starting_slots}
-    for slot, cnt in starting_slots.items():
-        for p in groups.get(slot, []):
-            if p not in used and len(lineup[slot]) < cnt:
-                lineup[slot].append(p)
-                used.add(p)
-    bench = [p for p in roster if p not in used]
-    return lineup, bench
+
+    # Dedicated slots: rank within each position and keep the top `cnt` in one pass
+    ranked = df.sort_values("proj", ascending=False, kind="stable")
+    caps = {slot: int(cnt) for slot, cnt in starting_slots.items() if slot != "FLEX"}
+    starters = ranked[ranked.groupby("pos").cumcount() < ranked["pos"].map(caps).fillna(0)]
+    for i, pos in zip(starters.index, starters["pos"]):
+        lineup[pos].append(roster[i])
+    used = df.index.isin(starters.index)
+
+    # FLEX draws from whichever RB/WR/TE are left over
+    if "FLEX" in starting_slots:
+        picks = df[df["pos"].isin(FLEX_POSITIONS) & ~used].nlargest(int(starting_slots["FLEX"]), "proj").index
+        lineup["FLEX"] = [roster[i] for i in picks]
+        used |= df.index.isin(picks)
+    bench = [p for p, u in zip(roster, used) if not u]
+    proj_map = dict(zip(roster, zip(df["proj"].tolist(), df["ros"].tolist())))
+    return lineup, bench, proj_map
+
+
+# --------------- Charts ---------------
+def _altair():
+    # Imported on first chart render; most reruns never reach the Advanced Stats view
+    import altair as alt
+
+    alt.data_transformers.disable_max_rows()
+    return alt
+
+
+@st.cache_data(max_entries=8)
+def melt_for_chart(df: pd.DataFrame, value_vars: tuple) -> pd.DataFrame:
+    """Long-form (Player, Pos, Type, Points) frame for the grouped bar chart."""
+    # value columns are float already (see league_projection_frame); melt only what's charted
+    return df[["Player", "Pos", *value_vars]].melt(
+        id_vars=["Player", "Pos"],
+        var_name="Type",
+        value_name="Points",
+    )
 
 
 # --------------- League connect ---------------
+class _PooledRequests:
+    """Stand-in for the `requests` module inside espn_api that routes get() through the pool."""
+
+    def __init__(self, session: requests.Session):
+        self._session = session
+
+    def get(self, *args, **kwargs):
+        return self._session.get(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(requests, name)
+
+
+def _pool_espn_requests():
+    # espn_api has no session hook and calls the bare requests.get per endpoint
+    from espn_api.requests import espn_requests
+
+    if not isinstance(espn_requests.requests, _PooledRequests):
+        espn_requests.requests = _PooledRequests(http_session())
+
+
+@st.cache_resource(ttl=15 * 60, show_spinner="Loading ESPN league…")
+def _make_league(league_id: int, year: int, espn_s2: str, swid: str) -> League:
+    # League() fetches settings, teams and rosters; reuse it across reruns
+    _pool_espn_requests()
+    return League(league_id=league_id, year=year, espn_s2=espn_s2, swid=swid)
+
+
 def connect_league():
     # from secrets
     espn_s2 = st.secrets.get("espn_s2", "")
@@ -226,17 +414,168 @@ def connect_league():
         st.error("Missing ESPN cookies. Set `espn_s2` and `swid` in .streamlit/secrets.toml")
         st.stop()
 
-    l = League(league_id=int(league_id), year=int(year), espn_s2=espn_s2, swid=swid)
+    l = _make_league(int(league_id), int(year), espn_s2, swid)
     t = l.teams[int(team_id) - 1]
     return l, t
 
 
-def get_all_rostered_names(lg: League) -> set:
-    names = set()
-    for tm in lg.teams:
-        for p in tm.roster:
-            names.add(p.name.strip())
-    return names
+@st.cache_resource(ttl=5 * 60, show_spinner=False)
+def box_scores(_lg: League, league_id: int, year: int, week: int) -> list:
+    # _lg is skipped when hashing; league_id/year/week key the cache instead
+    return _lg.box_scores(week)
+
+
+FA_FETCH_MAX = 500
+FA_POSITIONS = ["QB", "RB", "WR", "TE", "K", "D/ST"]
+
+
+def _espn_free_agents(lg: League, pos: str, size: int) -> list:
+    """ESPN free agents at `pos`; [] when ESPN has none or errors."""
+    try:
+        return list(lg.free_agents(position=pos, size=size))
+    except Exception:
+        if pos == "D/ST":
+            # older leagues only answer to "DST"
+            try:
+                return list(lg.free_agents(position="DST", size=size))
+            except Exception:
+                pass
+        return []
+
+
+@st.cache_resource(ttl=10 * 60, show_spinner=False)
+def free_agent_pool(_lg: League, league_id: int, year: int, week: int, size: int) -> dict:
+    """pos -> ESPN free agents, shared by every view. The six requests run concurrently."""
+    with ThreadPoolExecutor(max_workers=len(FA_POSITIONS)) as ex:
+        futs = {pos: ex.submit(_espn_free_agents, _lg, pos, size) for pos in FA_POSITIONS}
+        return {pos: fut.result() for pos, fut in futs.items()}
+
+
+def roster_index(lg: League) -> dict:
+    """team_id -> {player name: Player}, so label lookups don't rescan rosters."""
+    return {tm.team_id: {p.name: p for p in tm.roster} for tm in lg.teams}
+
+
+def league_projection_frame(lg: League) -> pd.DataFrame:
+    """One row per rostered player in the league with this render's projections."""
+    entries = [(tm.team_id, p) for tm in lg.teams for p in tm.roster]
+    players = [p for _, p in entries]
+    # explicit object dtype: before the draft every roster is empty and pandas would type these float
+    return pd.DataFrame({
+        "player": pd.Series(players, dtype=object),
+        "name": pd.Series([p.name for p in players], dtype=object),
+        "pos": pd.Series([getattr(p, "position", "") for p in players], dtype=object),
+        "team_id": [tid for tid, _ in entries],
+        "proj_wk": np.fromiter((get_proj_week(p) for p in players), dtype=float, count=len(players)),
+        "proj_ros": np.fromiter((ros_estimate(p) for p in players), dtype=float, count=len(players)),
+        "ros_espn": np.fromiter((get_ros_espn(p) for p in players), dtype=float, count=len(players)),
+        "ros_fp": np.fromiter((get_ros_fp(p) for p in players), dtype=float, count=len(players)),
+    })
+
+
+def build_fa_table(lg: League, team, starting_slots: dict,
+                   weekly_threshold: float, ros_threshold: float) -> pd.DataFrame:
+    """Every free agent vs. the best drop at its position, with a verdict.
+
+    `_rank` orders verdicts (2 = add & starts, 1 = add, 0 = pass); callers drop it for display.
+    """
+    lineup, bench, proj_map = build_optimizer(team.roster, starting_slots)
+    starters_by_pos = {k: lineup.get(k, []) for k in FA_POSITIONS}
+    bench_by_pos = {}
+    for p in bench:
+        bench_by_pos.setdefault(getattr(p, "position", ""), []).append(p)
+    flex_bench = [p for pos in FLEX_POSITIONS for p in bench_by_pos.get(pos, [])]
+
+    def _best_drop(pos):
+        # among bench at same pos else flex pool
+        pool = bench_by_pos.get(pos) or (flex_bench if pos in FLEX_POSITIONS else None)
+        if not pool:
+            return None
+        return min(pool, key=lambda p: (RO[p], PW[p]))
+
+    fa_pool = free_agent_pool(lg, lg.league_id, lg.year, lg.current_week, FA_FETCH_MAX)
+    fas_by_pos, source_by_pos = {}, {}
+    for pos in FA_POSITIONS:
+        source_used = "ESPN"
+        # BIG ESPN pull
+        fas = fa_pool[pos]
+
+        # FP fallback if truly nothing
+        if not fas:
+            fas = fp_free_agents(pos, ROSTERED_NAMES, FA_FETCH_MAX)
+            source_used = "FantasyPros"
+
+        fas_by_pos[pos] = fas
+        source_by_pos[pos] = source_used
+
+    fa_all = [(pos, fa) for pos in FA_POSITIONS for fa in fas_by_pos[pos]]
+    if not fa_all:
+        return pd.DataFrame()
+
+    n = len(fa_all)
+    # One projection pass over roster + FA pool; everything below reads these dicts
+    PW = {p: wk for p, (wk, _) in proj_map.items()}
+    RO = {p: ros for p, (_, ros) in proj_map.items()}
+    for _, fa in fa_all:
+        PW[fa] = get_proj_week(fa)
+        RO[fa] = ros_estimate(fa)
+
+    # Drop candidates and the bar to start only depend on position; work them out once
+    drop_by_pos = {pos: _best_drop(pos) for pos in FA_POSITIONS}
+    worst_by_pos = {pos: min(PW[x] for x in slot) for pos, slot in starters_by_pos.items() if slot}
+    worst_flex = min((PW[x] for x in lineup.get("FLEX", [])), default=np.inf)
+    drops = [drop_by_pos[pos] for pos, _ in fa_all]
+
+    # Gather projections into arrays, then do deltas / verdicts column-wise
+    fa_w = np.fromiter((PW[fa] for _, fa in fa_all), dtype=float, count=n)
+    fa_ros = np.fromiter((RO[fa] for _, fa in fa_all), dtype=float, count=n)
+    d_w = np.fromiter((PW[d] if d else 0.0 for d in drops), dtype=float, count=n)
+    d_ros = np.fromiter((RO[d] if d else 0.0 for d in drops), dtype=float, count=n)
+    has_drop = np.fromiter((d is not None for d in drops), dtype=bool, count=n)
+    # Would start: beats the weakest starter at its own position, or the weakest FLEX
+    fa_pos = np.array([getattr(fa, "position", "") for _, fa in fa_all])
+    pos_bar = np.fromiter((worst_by_pos.get(p, np.inf) for p in fa_pos), dtype=float, count=n)
+    starts = (fa_w > pos_bar) | (np.isin(fa_pos, FLEX_POSITIONS) & (fa_w > worst_flex))
+
+    # With no drop candidate the gain is the FA's own projection
+    gain_w = fa_w - d_w
+    gain_ros = fa_ros - d_ros
+    worth = (gain_w >= weekly_threshold) | (gain_ros >= ros_threshold)
+    # Integer rank so "Add (starts)" > "Add" > "Pass" sorts numerically, not by emoji code point
+    verdict_rank = np.select([worth & has_drop & starts, worth], [2, 1], 0)
+    verdict = np.array(["❌ Pass", "✅ Add", "✅ Add (starts)"])[verdict_rank]
+
+    return pd.DataFrame({
+        "Player": [fa.name for _, fa in fa_all],
+        "Pos": [pos for pos, _ in fa_all],
+        "Team": [getattr(fa, "proTeam", "N/A") for _, fa in fa_all],
+        "Bye": [getattr(fa, "bye_week", "N/A") for _, fa in fa_all],
+        "Source": [source_by_pos[pos] for pos, _ in fa_all],
+        f"Weekly ({proj_source})": fa_w.round(1),
+        "ROS (est.)": fa_ros.round(1),
+        "Drop": [f"{d.name} ({getattr(d, 'position', '')})" if d else "-" for d in drops],
+        "Δ Weekly": np.where(has_drop, gain_w, 0.0).round(1),
+        "Δ ROS (est.)": np.where(has_drop, gain_ros, 0.0).round(1),
+        "Would Start?": np.where(starts, "Yes", "No"),
+        "Verdict": verdict,
+        "_rank": verdict_rank,
+    })
+
+
+def threshold_inputs(prefix: str, c_wk, c_ros) -> tuple:
+    """Worth-it thresholds; every FA view reads and writes the same session values."""
+    wk = c_wk.number_input("Worth-it threshold (Δ Weekly)", 0.0, 20.0,
+                           st.session_state.get("weekly_threshold", 2.0), step=0.5, key=f"{prefix}_weekly")
+    ros = c_ros.number_input("Worth-it threshold (Δ ROS est.)", 0.0, 300.0,
+                             st.session_state.get("ros_threshold", 18.0), step=1.0, key=f"{prefix}_ros")
+    st.session_state["weekly_threshold"], st.session_state["ros_threshold"] = wk, ros
+    return wk, ros
+
+
+@st.cache_data(max_entries=8)
+def fa_labels(rows: tuple) -> list:
+    """What-If picker labels from (name, pos, weekly, ROS) tuples; idle reruns hit the cache."""
+    return [f"{n} — {pos} ({wk:.1f} wk / {ros:.1f} ROS)" for n, pos, wk, ros in rows]
 
 
 # =========================================
@@ -245,6 +584,7 @@ def get_all_rostered_names(lg: League) -> set:
 st.title("🏈 Fantasy Football Weekly Starter Optimizer")
 
 league, my_team = connect_league()
+ROSTER_BY_NAME = roster_index(league)
 st.subheader(f"Team: **{my_team.team_name}** ({my_team.team_abbrev})")
 
 # projection source (weekly)
@@ -259,6 +599,12 @@ with st.sidebar:
 # fetch FP data
 FP_WEEKLY = fp_weekly_all()
 FP_SEASON = fp_season_all()
+FP_WEEKLY_IDX = {k: _fp_index(df) for k, df in FP_WEEKLY.items()}
+FP_SEASON_IDX = {k: _fp_index(df) for k, df in FP_SEASON.items()}
+
+# project every rostered player once; views slice this instead of re-walking rosters
+ALL_PLAYERS_DF = league_projection_frame(league)
+ROSTERED_NAMES = frozenset(name.strip() for name in ALL_PLAYERS_DF["name"])
 
 # lineup config
 with st.expander("Lineup Slots", expanded=True):
@@ -274,8 +620,10 @@ with st.expander("Lineup Slots", expanded=True):
 
 starting_slots = {"QB": QB, "RB": RB, "WR": WR, "TE": TE, "FLEX": FLEX, "D/ST": DST, "K": K}
 
-# ---------- TABS (sequential, unique) ----------
-tabs = st.tabs([
+# ---------- VIEWS (sequential, unique) ----------
+# st.tabs executes every tab body on each rerun, so a horizontal radio picks the
+# view instead and only the selected view's projections / ESPN calls run.
+VIEWS = [
     "✅ Optimizer",         # 0
     "🔍 Matchups",         # 1
     "🔄 Trade Analyzer",   # 2
@@ -283,26 +631,34 @@ tabs = st.tabs([
     "🧾 Waiver Tracker",   # 4
     "🧪 What-If Lineup",   # 5
     "📊 Advanced Stats",   # 6
-])
+]
+active_view = st.radio("View", VIEWS, horizontal=True, key="active_tab", label_visibility="collapsed")
 
 # =========================================
 # Tab 0: Optimizer
 # =========================================
-with tabs[0]:
+if active_view == VIEWS[0]:
     roster = my_team.roster
-    lineup, bench = build_optimizer(roster, starting_slots)
+    lineup, bench, proj_map = build_optimizer(roster, starting_slots)
 
     st.markdown(f"### Optimized Starting Lineup ({proj_source} weekly)")
-    for slot, players in lineup.items():
-        for p in players:
-            st.write(
-                f"**{slot}**: {p.name} — {get_proj_week(p):.1f} wk | "
-                f"{ros_estimate(p):.1f} ROS"
-            )
+    slots = [slot for slot, players in lineup.items() for _ in players]
+    starters = [p for players in lineup.values() for p in players]
+    st.dataframe(pd.DataFrame({
+        "Slot": slots,
+        "Player": [p.name for p in starters],
+        "Pos": [getattr(p, "position", "") for p in starters],
+        f"Weekly ({proj_source})": [round(proj_map[p][0], 1) for p in starters],
+        "ROS (est.)": [round(proj_map[p][1], 1) for p in starters],
+    }), use_container_width=True, hide_index=True)
 
     st.markdown("### Bench")
-    for p in bench:
-        st.write(f"{p.name} — {get_proj_week(p):.1f} wk | {ros_estimate(p):.1f} ROS")
+    st.dataframe(pd.DataFrame({
+        "Player": [p.name for p in bench],
+        "Pos": [getattr(p, "position", "") for p in bench],
+        f"Weekly ({proj_source})": [round(proj_map[p][0], 1) for p in bench],
+        "ROS (est.)": [round(proj_map[p][1], 1) for p in bench],
+    }), use_container_width=True, hide_index=True)
 
     st.markdown("#### 🧠 How this lineup was chosen")
     st.caption(
@@ -313,14 +669,14 @@ with tabs[0]:
 # =========================================
 # Tab 1: Matchups
 # =========================================
-with tabs[1]:
+if active_view == VIEWS[1]:
     st.markdown("### This Week's Matchups & Projections")
     try:
         st.caption(f"Week {league.current_week}")
 
         games = []
         my_game = None
-        for bs in league.box_scores():
+        for bs in box_scores(league, league.league_id, league.year, league.current_week):
             home, away = bs.home_team, bs.away_team
             hp = safe_float(getattr(home, "projected_total", 0))
             ap = safe_float(getattr(away, "projected_total", 0))
@@ -358,7 +714,7 @@ with tabs[1]:
 # =========================================
 # Tab 2: Trade Analyzer (lean version)
 # =========================================
-with tabs[2]]:
+if active_view == VIEWS[2]:
     st.markdown("### 🔄 Team-to-Team Trade Analyzer")
     st.caption("Weekly uses your chosen source. ROS uses a best-effort estimate (ESPN/FP/fallback).")
 
@@ -380,11 +736,15 @@ with tabs[2]]:
         st.warning("Pick two different teams to evaluate a trade.")
     else:
         def roster_labels(team):
-            return [f"{p.name} — {p.position} ({get_proj_week(p):.1f} wk / {ros_estimate(p):.1f} ROS)" for p in team.roster]
+            rows = ALL_PLAYERS_DF[ALL_PLAYERS_DF["team_id"] == team.team_id]
+            return [
+                f"{nm} — {pos} ({wk:.1f} wk / {ros:.1f} ROS)"
+                for nm, pos, wk, ros in zip(rows["name"], rows["pos"], rows["proj_wk"], rows["proj_ros"])
+            ]
 
         def str_to_player(lbl, team):
             nm = lbl.split(" — ")[0]
-            return next((p for p in team.roster if p.name == nm), None)
+            return ROSTER_BY_NAME[team.team_id].get(nm)
 
         col1, col2 = st.columns(2)
         with col1:
@@ -410,197 +770,87 @@ with tabs[2]]:
 # =========================================
 # Tab 3: Free Agents (with big ESPN pool + ROS est.)
 # =========================================
-with tabs[3]:
+if active_view == VIEWS[3]:
     st.markdown("### 🛒 Free Agents — Add/Drop Recommendations")
     st.caption("Pulls a **large** ESPN FA pool. ROS shows an estimate (ESPN/FP/fallback).")
 
     fa_size = st.slider("Rows to show (per table)", 10, 200, 80, step=10)
-    weekly_threshold = st.number_input("Worth-it threshold (Δ Weekly)", 0.0, 20.0, 2.0, step=0.5)
-    ros_threshold = st.number_input("Worth-it threshold (Δ ROS est.)", 0.0, 300.0, 18.0, step=1.0)
-
-    FA_FETCH_MAX = 500
-    positions = ["QB", "RB", "WR", "TE", "K", "D/ST"]
-    rostered_names = get_all_rostered_names(league)
-
-    lineup, bench = build_optimizer(my_team.roster, starting_slots)
-    starters_by_pos = {k: lineup.get(k, []) for k in ["QB", "RB", "WR", "TE", "K", "D/ST"]}
-
-    def _would_start(pl):
-        pos = getattr(pl, "position", "")
-        val = get_proj_week(pl)
-        slot = starters_by_pos.get(pos, [])
-        if slot:
-            worst = min(slot, key=lambda x: get_proj_week(x))
-            if val > get_proj_week(worst):
-                return True
-        if pos in ["RB", "WR", "TE"] and lineup.get("FLEX"):
-            worst_flex = min(lineup["FLEX"], key=lambda x: get_proj_week(x))
-            return val > get_proj_week(worst_flex)
-        return False
-
-    def _best_drop(pos):
-        # among bench at same pos else flex pool
-        pool = [p for p in bench if getattr(p, "position", "") == pos]
-        if not pool and pos in ["RB", "WR", "TE"]:
-            pool = [p for p in bench if getattr(p, "position", "") in ["RB", "WR", "TE"]]
-        if not pool:
-            return None
-        return sorted(pool, key=lambda p: (ros_estimate(p), get_proj_week(p)))[0]
-
-    rows = []
-    for pos in positions:
-        source_used = "ESPN"
-        # BIG ESPN pull
-        try:
-            try:
-                fas = league.free_agents(position=pos, size=FA_FETCH_MAX)
-            except Exception:
-                fas = league.free_agents(position="DST", size=FA_FETCH_MAX) if pos == "D/ST" else []
-        except Exception:
-            fas = []
-
-        # FP fallback if truly nothing
-        if not fas:
-            key = {"QB": "qb", "RB": "rb", "WR": "wr", "TE": "te", "K": "k", "D/ST": "dst"}[pos]
-            df = FP_WEEKLY.get(key, pd.DataFrame())
-            if not df.empty and "FPTS" in df.columns:
-                df = df[~df["Player"].isin(rostered_names)].copy()
-                df["FPTS_num"] = pd.to_numeric(df["FPTS"], errors="coerce").fillna(0.0)
-                df.sort_values("FPTS_num", ascending=False, inplace=True)
-                df = df.head(FA_FETCH_MAX)
-                # create light fake player objects
-                class FPPlayer:
-                    def __init__(self, name):
-                        self.name = name
-                        self.position = pos
-                        self.proTeam = "N/A"
-                        self.bye_week = "N/A"
-                fas = [FPPlayer(r["Player"]) for _, r in df.iterrows()]
-            source_used = "FantasyPros"
+    weekly_threshold, ros_threshold = threshold_inputs("fa", st, st)
 
-        for fa in fas:
-            fa_w = get_proj_week(fa)
-            fa_ros = ros_estimate(fa)
-            drop = _best_drop(pos)
-            if drop:
-                d_w = get_proj_week(drop)
-                d_ros = ros_estimate(drop)
-                delta_w = fa_w - d_w
-                delta_ros = fa_ros - d_ros
-                worth = (delta_w >= weekly_threshold) or (delta_ros >= ros_threshold)
-                verdict = "✅ Add (starts)" if worth and _would_start(fa) else ("✅ Add" if worth else "❌ Pass")
-                drop_name = f"{drop.name} ({getattr(drop,'position','')})"
-            else:
-                delta_w = delta_ros = 0.0
-                verdict = "✅ Add" if fa_w >= weekly_threshold or fa_ros >= ros_threshold else "❌ Pass"
-                drop_name = "-"
-
-            rows.append({
-                "Player": fa.name,
-                "Pos": pos,
-                "Team": getattr(fa, "proTeam", "N/A"),
-                "Bye": getattr(fa, "bye_week", "N/A"),
-                "Source": source_used,
-                f"Weekly ({proj_source})": round(fa_w, 1),
-                "ROS (est.)": round(fa_ros, 1),
-                "Drop": drop_name,
-                "Δ Weekly": round(delta_w, 1),
-                "Δ ROS (est.)": round(delta_ros, 1),
-                "Would Start?": "Yes" if _would_start(fa) else "No",
-                "Verdict": verdict,
-            })
-
-    if not rows:
+    df_fa = build_fa_table(league, my_team, starting_slots, weekly_threshold, ros_threshold)
+    if df_fa.empty:
         st.info("No free agents found via ESPN or FP fallback.")
     else:
-        df_fa = pd.DataFrame(rows)
-        df_fa.sort_values(by=["Verdict", "Δ Weekly", "Δ ROS (est.)"],
-                          ascending=[False, False, False], inplace=True)
-        st.dataframe(df_fa.head(fa_size), use_container_width=True)
+        top = df_fa.nlargest(fa_size, ["_rank", "Δ Weekly", "Δ ROS (est.)"]).drop(columns="_rank")
+        st.dataframe(top, use_container_width=True)
 
 # =========================================
-# Tab 4: Waiver Tracker (uses FA table if present)
+# Tab 4: Waiver Tracker (same FA table, ranked purely by gain)
 # =========================================
-with tabs[4]:
+if active_view == VIEWS[4]:
     st.markdown("### 🧾 Waiver Wire Tracker")
     st.caption("Ranks FAs by Δ Weekly and Δ ROS (est.) vs best drop.")
 
     wt_fa_size = st.slider("Rows to show", 10, 200, 60, step=10, key="wt_rows")
+    wt_weekly, wt_ros = threshold_inputs("wt", *st.columns(2))
     view_cols = [
         "Player", "Pos", "Team", "Bye", "Source",
         f"Weekly ({proj_source})", "ROS (est.)",
         "Drop", "Δ Weekly", "Δ ROS (est.)", "Would Start?", "Verdict"
     ]
-    if "df_fa" in locals() and not df_fa.empty:
-        view = df_fa.sort_values(by=["Δ Weekly", "Δ ROS (est.)"], ascending=False)
-        st.dataframe(view[view_cols].head(wt_fa_size), use_container_width=True)
+    df_fa = build_fa_table(league, my_team, starting_slots, wt_weekly, wt_ros)
+    if df_fa.empty:
+        st.info("No free agents found via ESPN or FP fallback.")
     else:
-        st.info("Open the Free Agents tab first (or refresh).")
+        view = df_fa.nlargest(wt_fa_size, ["Δ Weekly", "Δ ROS (est.)"])
+        st.dataframe(view[view_cols], use_container_width=True)
 
 # =========================================
 # Tab 5: What-If Lineup (simulate adding FA)
 # =========================================
-with tabs[5]:
+if active_view == VIEWS[5]:
     st.markdown("### 🧪 What-If: If I picked up a free agent, my starting lineup would be…")
     size = st.slider("FA pool per position to consider", 10, 200, 50, step=10)
-    rostered_names = get_all_rostered_names(league)
-    FA_FETCH_MAX = 300
 
+    # Same cached pool as the Free Agents view; the slider only trims it
+    fa_pool = free_agent_pool(league, league.league_id, league.year, league.current_week, FA_FETCH_MAX)
     pool = []
-    for pos in ["QB", "RB", "WR", "TE", "K", "D/ST"]:
-        f = []
-        try:
-            try:
-                f = league.free_agents(position=pos, size=FA_FETCH_MAX)
-            except Exception:
-                if pos == "D/ST":
-                    f = league.free_agents(position="DST", size=FA_FETCH_MAX)
-        except Exception:
-            f = []
-
+    for pos in FA_POSITIONS:
+        f = fa_pool[pos][:size]
         if not f:
-            key = {"QB": "qb", "RB": "rb", "WR": "wr", "TE": "te", "K": "k", "D/ST": "dst"}[pos]
-            df = FP_WEEKLY.get(key, pd.DataFrame())
-            if not df.empty and "FPTS" in df.columns:
-                df = df[~df["Player"].isin(rostered_names)].copy()
-                df["FPTS_num"] = pd.to_numeric(df["FPTS"], errors="coerce").fillna(0.0)
-                df.sort_values("FPTS_num", ascending=False, inplace=True)
-                df = df.head(FA_FETCH_MAX)
-                class FPPlayer:
-                    def __init__(self, name):
-                        self.name = name
-                        self.position = pos
-                        self.proTeam = "N/A"
-                        self.bye_week = "N/A"
-                f = [FPPlayer(r["Player"]) for _, r in df.iterrows()]
+            f = fp_free_agents(pos, ROSTERED_NAMES, size)
         pool.extend(f)
 
-    names = [f"{p.name} — {getattr(p,'position','')} ({get_proj_week(p):.1f} wk / {ros_estimate(p):.1f} ROS)" for p in pool]
+    rows = tuple((p.name, getattr(p, "position", ""), get_proj_week(p), ros_estimate(p)) for p in pool)
+    label_to_player = {}
+    for label, p in zip(fa_labels(rows), pool):
+        label_to_player.setdefault(label, p)  # first player wins on a duplicate label
+    names = list(label_to_player)
     pick = st.selectbox("Free agent to add", options=["— pick a player —"] + names)
     drop_opts = ["(auto choose best drop)"] + [f"{p.name} — {p.position}" for p in my_team.roster]
     drop_sel = st.selectbox("Who would you drop?", options=drop_opts)
 
     if pick and pick != "— pick a player —":
-        fa = pool[names.index(pick)]  # 1:1 mapping (no placeholder offset due to list construction)
-        lineup, bench = build_optimizer(my_team.roster, starting_slots)
+        fa = label_to_player[pick]
+        cur_lineup, bench, cur_proj = build_optimizer(my_team.roster, starting_slots)
         if drop_sel == "(auto choose best drop)":
             candidate_pool = bench or my_team.roster
-            drop = sorted(candidate_pool, key=lambda p: (ros_estimate(p), get_proj_week(p)))[0]
+            drop = min(candidate_pool, key=lambda p: (cur_proj[p][1], cur_proj[p][0]))
         else:
             drop_name = drop_sel.split(" — ")[0]
-            drop = next((p for p in my_team.roster if p.name == drop_name), None)
+            drop = ROSTER_BY_NAME[my_team.team_id].get(drop_name)
 
         hypo = [p for p in my_team.roster if p != drop] + [fa]
-        cur_lineup, _ = build_optimizer(my_team.roster, starting_slots)
-        new_lineup, _ = build_optimizer(hypo, starting_slots)
+        new_lineup, _, new_proj = build_optimizer(hypo, starting_slots)
 
-        def total(lp):
-            w = sum(get_proj_week(p) for L in lp.values() for p in L)
-            r = sum(ros_estimate(p) for L in lp.values() for p in L)
+        def total(lp, proj):
+            # (weekly, ROS) pairs for every starter -> column sums
+            pairs = np.array([proj[p] for L in lp.values() for p in L], dtype=float).reshape(-1, 2)
+            w, r = pairs.sum(axis=0)
             return w, r
 
-        cur_w, cur_ros = total(cur_lineup)
-        new_w, new_ros = total(new_lineup)
+        cur_w, cur_ros = total(cur_lineup, cur_proj)
+        new_w, new_ros = total(new_lineup, new_proj)
 
         st.markdown("#### Result")
         st.write(
@@ -612,50 +862,40 @@ with tabs[5]:
 # =========================================
 # Tab 6: Advanced Stats
 # =========================================
-with tabs[6]:
+if active_view == VIEWS[6]:
     st.markdown("### 📊 Advanced Player Stats")
 
     try:
-        adv_rows = []
-        for p in my_team.roster:
-            adv_rows.append({
-                "Player": getattr(p, "name", "N/A"),
-                "Pos": getattr(p, "position", "N/A"),
-                f"Weekly ({proj_source})": get_proj_week(p),
-                "ROS ESPN": get_ros_espn(p),
-                "ROS FP": get_ros_fp(p),
-                "Last Week": getattr(p, "points", 0),
-                "Opponent": getattr(p, "pro_opponent", "N/A"),
-            })
-        df_adv = pd.DataFrame(adv_rows)
+        mine = ALL_PLAYERS_DF[ALL_PLAYERS_DF["team_id"] == my_team.team_id]
+        df_adv = pd.DataFrame({
+            "Player": mine["name"],
+            "Pos": mine["pos"],
+            f"Weekly ({proj_source})": mine["proj_wk"],
+            "ROS ESPN": mine["ros_espn"],
+            "ROS FP": mine["ros_fp"],
+            "Last Week": [getattr(p, "points", 0) for p in mine["player"]],
+            "Opponent": [getattr(p, "pro_opponent", "N/A") for p in mine["player"]],
+        }).reset_index(drop=True)
 
         st.dataframe(df_adv, use_container_width=True)
 
-if not df_adv.empty:
-    df_melt = df_adv.melt(
-        id_vars=["Player", "Pos"],
-        value_vars=[f"Weekly ({proj_source})", "ROS ESPN", "ROS FP"],
-        var_name="Type",
-        value_name="Points",
-    )
-    df_melt["Points"] = pd.to_numeric(df_melt["Points"], errors="coerce").fillna(0)
-
-    # Import Altair locally with a unique alias
-    import altair as altair
-
-    chart = (
-        altair.Chart(df_melt)
-        .mark_bar()
-        .encode(
-            x=altair.X("Player:N", sort="-y"),
-            y=altair.Y("Points:Q"),
-            color="Type:N",
-            column="Pos:N",
-            tooltip=["Player", "Pos", "Type", "Points"],
-        )
-        .properties(width=140, height=260)
-    )
-    st.altair_chart(chart, use_container_width=True)
+        if not df_adv.empty:
+            df_melt = melt_for_chart(df_adv, (f"Weekly ({proj_source})", "ROS ESPN", "ROS FP"))
+            alt = _altair()
+
+            chart = (
+                alt.Chart(df_melt)
+                .mark_bar()
+                .encode(
+                    x=alt.X("Player:N", sort="-y"),
+                    y=alt.Y("Points:Q"),
+                    color="Type:N",
+                    column="Pos:N",
+                    tooltip=["Player", "Pos", "Type", "Points"],
+                )
+                .properties(width=140, height=260)
+            )
+            st.altair_chart(chart, use_container_width=True)
 
         else:
             st.info("No data available yet for advanced stats.")